@@ -1,9 +1,8 @@
 import asyncio
 import contextlib
-import datetime
 import re
 import textwrap
-from functools import partial
+from functools import lru_cache, partial
 from signal import Signals
 from typing import Any, Optional, Tuple, overload
 
@@ -36,19 +35,14 @@ log = get_logger(__name__)
 INLINE_EVAL_REGEX = re.compile(r"\$(?P<fence>`+)(.+)(?P=fence)")
 
 ESCAPE_REGEX = re.compile("[`\u202E\u200B]{3,}")
+MENTION_REGEX = re.compile("<!?@")
 FORMATTED_CODE_REGEX = re.compile(
     r"(?P<delim>(?P<block>```)|``?)"  # code delimiter: 1-3 backticks; (?P=block) only matches if it's a block
-    r"(?(block)(?:(?P<lang>[a-z]+)\n)?)"  # if we're in a block, match optional language (only letters plus newline)
+    r"(?(block)(?:(?P<lang>[A-Za-z]+)\n)?)"  # if we're in a block, match optional language (only letters plus newline)
     r"(?:[ \t]*\n)*"  # any blank (empty or tabs/spaces only) lines before the code
     r"(?P<code>.*?)"  # extract all code inside the markup
     r"\s*"  # any more whitespace before the end of the code markup
     r"(?P=delim)",  # match the exact same delimiter from the start again
-    re.DOTALL | re.IGNORECASE,  # "." also matches newlines, case insensitive
-)
-RAW_CODE_REGEX = re.compile(
-    r"^(?:[ \t]*\n)*"  # any blank (empty or tabs/spaces only) lines before the code
-    r"(?P<code>.*?)"  # extract all the rest as code
-    r"\s*$",  # any trailing whitespace until the end of the string
     re.DOTALL,  # "." also matches newlines
 )
 
@@ -56,10 +50,13 @@ MAX_PASTE_LEN = 10000
 
 
 SIGKILL = 9
+SIGNAL_NAMES = {signal.value: signal.name for signal in Signals}
 
 REEVAL_EMOJI = "\U0001f501"  # :repeat:
 REEVAL_TIMEOUT = 30
 
+EVAL_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 HEADERS = {}
 if URLs.snekbox_auth:
     HEADERS["Authorization"] = URLs.snekbox_auth
@@ -71,6 +68,13 @@ print(choice(("single quotes", 'double quotes')))
 """.lstrip()
 
 
+def strip_raw_code(code: str) -> str:
+    """Strip any blank lines before the code and all whitespace after it."""
+    # only whole lines are removed from the start, so the first line keeps its indentation
+    leading = len(code) - len(code.lstrip(" \t\n"))
+    return code[code.rfind("\n", 0, leading) + 1 :].rstrip()
+
+
 class EvalModal(Modal):
     """Modal for evaluation."""
 
@@ -91,7 +95,9 @@ class Snekbox(Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.jobs = {}
+        self.jobs: set[int] = set()
+        # all requests go through the bot's long-lived session to reuse its connection pool
+        assert isinstance(bot.http_session, aiohttp.ClientSession)
 
     async def post_eval(self, code: str) -> dict:
         """Send a POST request to the Snekbox API to evaluate code and return the results."""
@@ -103,7 +109,7 @@ class Snekbox(Cog):
                 json=data,
                 raise_for_status=True,
                 headers=HEADERS,
-                timeout=10,
+                timeout=EVAL_TIMEOUT,
             ) as resp:
                 return await resp.json()
         except aiohttp.ClientConnectorError:
@@ -129,6 +135,7 @@ class Snekbox(Cog):
         ...
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def prepare_input(code: str, *, require_fenced: bool = False) -> Optional[str]:
         """
         Extract code from the Markdown, format it, and insert it into the code template.
@@ -136,24 +143,36 @@ class Snekbox(Cog):
         If there is any code block, ignore text outside the code block.
         Use the first code block, but prefer a fenced code block.
         If there are several fenced code blocks, concatenate only the fenced code blocks.
+
+        Results are cached, as the same content is often parsed again by other commands.
         """
-        if match := list(FORMATTED_CODE_REGEX.finditer(code)):
-            blocks = [block for block in match if block.group("block")]
+        if require_fenced and code.count("`") < 2:
+            # any code markup needs at least a pair of backticks, no need to run the regex
+            return None
 
-            if len(blocks) > 1:
-                code = "\n".join(block.group("code") for block in blocks)
-                info = "several code blocks"
+        first = first_block = None
+        block_codes = []
+        if "`" in code:
+            for match in FORMATTED_CODE_REGEX.finditer(code):
+                first = first or match
+                if match.group("block"):
+                    first_block = first_block or match
+                    block_codes.append(match.group("code"))
+
+        if len(block_codes) > 1:
+            code = "\n".join(block_codes)
+            info = "several code blocks"
+        elif first:
+            match = first_block or first
+            code, block, lang, delim = match.group("code", "block", "lang", "delim")
+            if block:
+                info = (f"'{lang}' highlighted" if lang else "plain") + " code block"
             else:
-                match = match[0] if len(blocks) == 0 else blocks[0]
-                code, block, lang, delim = match.group("code", "block", "lang", "delim")
-                if block:
-                    info = (f"'{lang}' highlighted" if lang else "plain") + " code block"
-                else:
-                    info = f"{delim}-enclosed inline code"
+                info = f"{delim}-enclosed inline code"
         elif require_fenced:
             return None
         else:
-            code = RAW_CODE_REGEX.fullmatch(code).group("code")
+            code = strip_raw_code(code)
             info = "unformatted or badly formatted code"
 
         code = textwrap.dedent(code)
@@ -161,9 +180,8 @@ class Snekbox(Cog):
         return code
 
     @staticmethod
-    def get_results_message(results: dict) -> Tuple[str, str]:
+    def get_results_message(stdout: str, returncode: Optional[int]) -> Tuple[str, str]:
         """Return a user-friendly message and error corresponding to the process's return code."""
-        stdout, returncode = results["stdout"], results["returncode"]
         msg = f"Your eval job has completed with return code {returncode}"
         error = ""
 
@@ -177,20 +195,17 @@ class Snekbox(Cog):
             error = "A fatal NsJail error occurred"
         else:
             # Try to append signal's name if one exists
-            try:
-                name = Signals(returncode - 128).name
+            if name := SIGNAL_NAMES.get(returncode - 128):
                 msg = f"{msg} ({name})"
-            except ValueError:
-                pass
 
         return msg, error
 
     @staticmethod
-    def get_status_emoji(results: dict) -> str:
+    def get_status_emoji(stdout: str, returncode: Optional[int]) -> str:
         """Return an emoji corresponding to the status code or lack of output in result."""
-        if not results["stdout"].strip():  # No output
+        if not stdout.strip():  # No output
             return ":warning:"
-        elif results["returncode"] == 0:  # No error
+        elif returncode == 0:  # No error
             return ":white_check_mark:"
         else:  # Exception
             return ":x:"
@@ -208,25 +223,20 @@ class Snekbox(Cog):
         original_output = output  # To be uploaded to a pasting service if needed
         paste_link = None
 
-        if "<@" in output:
-            output = output.replace("<@", "<@\u200B")  # Zero-width space
-
-        if "<!@" in output:
-            output = output.replace("<!@", "<!@\u200B")  # Zero-width space
+        output = MENTION_REGEX.sub("\\g<0>\u200B", output)  # Zero-width space
 
-        if ESCAPE_REGEX.findall(output):
+        if ESCAPE_REGEX.search(output):
             paste_link = await self.upload_output(original_output) or "too long to upload"
             return "Code block escape attempt detected; will not output result", paste_link
 
         truncated = False
-        lines = output.count("\n")
+        # only split off the lines which will be shown, the 12th item holds the rest of the output if there is any
+        lines = output.split("\n", 11)
 
-        if lines > 0:
-            output = [f"{i:03d} | {line}" for i, line in enumerate(output.split("\n"), 1)]
-            output = output[:11]  # Limiting to only 11 lines
-            output = "\n".join(output)
+        if len(lines) > 1:
+            output = "\n".join(f"{i:03d} | {line}" for i, line in enumerate(lines[:11], 1))
 
-        if lines > 10:
+        if len(lines) > 11:
             truncated = True
             if len(output) >= 1000:
                 output = f"{output[:1000]}\n... (truncated - too long, too many lines)"
@@ -268,19 +278,20 @@ class Snekbox(Cog):
         if isinstance(ctx, Context):
             await ctx.trigger_typing()
         results = await self.post_eval(code)
-        msg, error = self.get_results_message(results)
+        stdout, returncode = results["stdout"], results["returncode"]
+        msg, error = self.get_results_message(stdout, returncode)
 
         if error:
             output, paste_link = error, None
         else:
-            output, paste_link = await self.format_output(results["stdout"])
+            output, paste_link = await self.format_output(stdout)
             if paste_link and Paste.alias_url and ctx.guild and ctx.guild.id == Guilds.nextcord:
                 paste_link = paste_link.replace(".disnake.", ".nextcord.")
 
-        icon = self.get_status_emoji(results)
+        icon = self.get_status_emoji(stdout, returncode)
         msg = f"{ctx.author.mention} {icon} {msg}.\n\n```\n{output}\n```"
 
-        log.info(f"{ctx.author}'s job had a return code of {results['returncode']}")
+        log.info(f"{ctx.author}'s job had a return code of {returncode}")
 
         if original_source:
             original_source = await self.upload_output(code)
@@ -320,9 +331,13 @@ class Snekbox(Cog):
                 await self.bot.wait_for("reaction_add", check=_predicate_emoji_reaction, timeout=30)
 
                 code = await self.get_code(new_message)
+                # both requests are independent, so delete the old response while removing the reaction
+                delete_task = scheduling.create_task(
+                    response.delete(), suppressed_exceptions=(HTTPException,), event_loop=self.bot.loop
+                )
                 await ctx.message.remove_reaction(REEVAL_EMOJI, ctx.me)
                 with contextlib.suppress(HTTPException):
-                    await response.delete()
+                    await delete_task
 
             except asyncio.TimeoutError:
                 await ctx.message.remove_reaction(REEVAL_EMOJI, ctx.me)
@@ -342,8 +357,8 @@ class Snekbox(Cog):
 
         if new_ctx.command is self.eval_command:
             log.trace(f"Message {message.id} invokes eval command.")
-            split = message.content.split(maxsplit=1)
-            code = split[1] if len(split) > 1 else None
+            # the context's view has already consumed the prefix and the invoked command
+            code = new_ctx.view.read_rest().strip() or None
         else:
             log.trace(f"Message {message.id} does not invoke eval command.")
             code = message.content
@@ -379,12 +394,12 @@ class Snekbox(Cog):
         log.info(f"Received code from {ctx.author} for evaluation:\n{code}")
 
         while True:
-            self.jobs[ctx.author.id] = datetime.datetime.now()
+            self.jobs.add(ctx.author.id)
             code = self.prepare_input(code)
             try:
                 response = await self.send_eval(ctx, code)
             finally:
-                del self.jobs[ctx.author.id]
+                self.jobs.discard(ctx.author.id)
 
             code = await self.continue_eval(ctx, response)
             if not code:
@@ -400,7 +415,10 @@ class Snekbox(Cog):
         if message.author.bot:
             return
 
-        code = "\n".join([m[-1].strip() for m in INLINE_EVAL_REGEX.findall(message.content)])
+        if "$`" not in message.content:
+            return
+
+        code = "\n".join(match[2].strip() for match in INLINE_EVAL_REGEX.finditer(message.content))
 
         if not code:
             return
@@ -1,4 +1,3 @@
-import asyncio
 import time
 from typing import Optional
 
@@ -124,11 +123,13 @@ class CodeBlockCog(Cog, name="Code Block"):
         bot_message = await message.channel.send(f"Hey {message.author.mention}!", embed=embed)
         self.codeblock_message_ids[message.id] = bot_message.id
 
-        async def add_task() -> None:
-            await asyncio.sleep(DELETE_PAUSE)
-            scheduling.create_task(wait_for_deletion(bot_message, (message.author.id,)), event_loop=self.bot.loop)
-
-        scheduling.create_task(add_task(), event_loop=self.bot.loop)
+        # schedule the delete button with a timer handle rather than a task sleeping for the whole pause
+        self.bot.loop.call_later(
+            DELETE_PAUSE,
+            lambda: scheduling.create_task(
+                wait_for_deletion(bot_message, (message.author.id,)), event_loop=self.bot.loop
+            ),
+        )
 
     def should_parse(self, message: disnake.Message) -> bool:
         """
@@ -30,6 +30,8 @@ _TICKS = {
 
 _RE_PYTHON_REPL = re.compile(r"^(>>>|\.\.\.)( |$)")
 _RE_IPYTHON_REPL = re.compile(r"^((In|Out) \[\d+\]: |\s*\.{3,}: ?)")
+# Statements which need neither an assignment nor a colon.
+_RE_SIMPLE_STATEMENT = re.compile(r"\b(?:import|return|raise|assert|del|pass|break|continue|global|nonlocal)\b")
 
 _RE_CODE_BLOCK = re.compile(
     fr"""
@@ -150,8 +152,28 @@ def _is_repl_code(content: str, threshold: int = 3) -> bool:
     return False
 
 
+def _may_be_python_code(content: str) -> bool:
+    """
+    Return False if `content` certainly isn't Python code with statements or (I)Python REPL output.
+
+    Anything other than an expression needs an assignment, a colon, or one of a few keywords, and
+    REPL output needs its prompts. This is much cheaper than parsing content which can never qualify.
+    """
+    return (
+        "=" in content
+        or ":" in content
+        or ">>>" in content
+        or "..." in content
+        or _RE_SIMPLE_STATEMENT.search(content) is not None
+    )
+
+
 def is_python_code(content: str) -> bool:
     """Return True if `content` is valid Python code or (I)Python REPL output."""
+    if not _may_be_python_code(content):
+        log.trace("Content has no statements and is not REPL output.")
+        return False
+
     dedented = textwrap.dedent(content)
 
     # Parse AST twice in case _fix_indentation ends up breaking code due to its inaccuracies.
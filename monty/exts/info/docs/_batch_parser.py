@@ -181,6 +181,18 @@ class BatchParser:
         """Map a DocItem to its page so that the symbol will be parsed once the page is requested."""
         self._page_doc_items[doc_item.url].append(doc_item)
 
+    def remove_package(self, package_name: str) -> None:
+        """
+        Forget the pages of the `package_name` package.
+
+        Symbols of the package which are already queued are still parsed.
+        """
+        for url, doc_items in list(self._page_doc_items.items()):
+            if doc_items := [item for item in doc_items if item.package != package_name]:
+                self._page_doc_items[url] = doc_items
+            else:
+                del self._page_doc_items[url]
+
     async def clear(self) -> None:
         """
         Clear all internal symbol data.
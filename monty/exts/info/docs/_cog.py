@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import copy
 import dataclasses
 import functools
+import heapq
+import itertools
 import re
-import sys
-import textwrap
-import typing
-from collections import ChainMap, defaultdict
 from functools import cached_property
+from operator import itemgetter
 from types import SimpleNamespace
 from typing import Any, Dict, Literal, Optional, Set, Tuple, TypedDict, Union
 
@@ -47,18 +47,23 @@ FORCE_PREFIX_GROUPS = (
     "pdbcommand",
     "2to3fixer",
 )
+FORCE_PREFIX_GROUP_RANKS = {group: rank for rank, group in enumerate(FORCE_PREFIX_GROUPS)}
 NOT_FOUND_DELETE_DELAY = RedirectOutput.delete_delay
 # Delay to wait before trying to reach a rescheduled inventory again, in minutes
 FETCH_RESCHEDULE_DELAY = SimpleNamespace(first=2, repeated=5)
 
 COMMAND_LOCK_SINGLETON = "inventory refresh"
+# Maximum number of inventories fetched at the same time during a refresh
+INVENTORY_FETCH_CONCURRENCY = 8
 
 CONFIG_DOC_PREFIX = "global.documentation"
 CONFIG_DOC_INVENTORIES = CONFIG_DOC_PREFIX + ".inventories"
 CONFIG_DOC_WHITELIST = CONFIG_DOC_PREFIX + ".whitelist"
 CONFIG_DOC_BLACKLIST = CONFIG_DOC_PREFIX + ".blacklist"
 
-DOCS_LINK_REGEX = re.compile(r"!`([\w.]+)`")
+# the literal every docs link starts with, checked before running the regex
+DOCS_LINK_ANCHOR = "!`"
+DOCS_LINK_REGEX = re.compile(re.escape(DOCS_LINK_ANCHOR) + r"([\w.]+)`")
 
 
 class DocDict(TypedDict):
@@ -70,9 +75,9 @@ class DocDict(TypedDict):
 
 
 BLACKLIST: dict[int, set[str]] = {}
-BLACKLIST_MAPPING: dict[int, list[str]] = {
-    constants.Guilds.disnake: ["nextcord"],
-    constants.Guilds.nextcord: ["disnake", "dislash"],
+BLACKLIST_MAPPING: dict[int, frozenset[str]] = {
+    constants.Guilds.disnake: frozenset({"nextcord"}),
+    constants.Guilds.nextcord: frozenset({"disnake", "dislash"}),
 }
 
 CUSTOM_ID_PREFIX = "docs_"
@@ -124,18 +129,29 @@ class DocView(DeleteView):
             return
 
     def sync_attribute_dropdown(self, current_attribute: str = None) -> None:
-        """Set up the attribute select menu."""
-        self.attribute_select._underlying.options = []
+        """Set up the attribute select menu, or mark `current_attribute` as selected if it's already set up."""
+        # the options never change, so they're only built once
+        if options := self.attribute_select.options:
+            for option in options:
+                option.default = option.value == current_attribute
+            return
+
+        prefix = self.docitem.symbol_name
+        options = []
         for attr in self.attributes[:25]:
-            if attr == self.docitem:
+            if attr is self.docitem:
                 continue
-            default = attr.symbol_name == current_attribute
-            self.attribute_select.add_option(
-                label=attr.symbol_name.removeprefix(self.docitem.symbol_name),
-                description=attr.group,
-                value=attr.symbol_name,
-                default=default,
+            name = attr.symbol_name
+            options.append(
+                disnake.SelectOption(
+                    label=name[len(prefix) :] if name.startswith(prefix) else name,
+                    description=attr.group,
+                    value=name,
+                    default=name == current_attribute,
+                )
             )
+        # set all options at once rather than validating the whole list again with each add_option
+        self.attribute_select._underlying.options = options
 
     def set_link_button(self, url: str = None) -> None:
         """Set the link button to the provided url, or the default url."""
@@ -192,12 +208,23 @@ class DocCog(commands.Cog):
         # Used to calculate inventory diffs on refreshes and to display all currently stored inventories.
         self.base_urls = {}
         self.bot = bot
-        # the new doc_symbols that collects each package in their own dict and uses a chainmap
+        # the new doc_symbols that collects each package in their own dict
         self.doc_symbols_new: Dict[str, Dict[str, DocItem]] = {}
+        # all of the symbols combined, with the same precedence as a chainmap of doc_symbols_new
+        self._all_symbols: Dict[str, DocItem] = {}
         self.item_fetcher = _batch_parser.BatchParser()
         # Maps a conflicting symbol name to a list of the new, disambiguated names created from conflicts with the name.
-        self.renamed_symbols = defaultdict(list)
+        self.renamed_symbols: Dict[str, list[str]] = {}
         self.whitelist: Dict[int, Set[str]] = {}
+        # Maps cache keys (see get_cache_key) to the sorted symbol names they can autocomplete,
+        # without any blacklisted packages.
+        self._autocomplete_choices: Dict[Optional[int], Tuple[str, ...]] = {}
+        # autocompletion sends a query on every keystroke and searches repeat them, so recent results are cached.
+        # these are called with the cache key of the guild, so guilds with the same configuration share results.
+        self._score_query = functools.lru_cache(maxsize=1024)(self._score_query)
+        self._search_symbols = functools.lru_cache(maxsize=512)(self._search_symbols)
+        # Maps guild ids with a whitelist to their merged symbols, cached alongside doc_symbols.
+        self._guild_packages: Dict[int, Dict[str, DocItem]] = {}
         self.inventory_scheduler = Scheduler(self.__class__.__name__)
 
         self.refresh_event = asyncio.Event()
@@ -211,34 +238,74 @@ class DocCog(commands.Cog):
         )
 
     @cached_property
-    def doc_symbols(self) -> typing.ChainMap[str, DocItem]:
+    def doc_symbols(self) -> Dict[str, DocItem]:
         """Maps symbol names to objects containing their metadata."""
-        if not self.whitelist:
-            return ChainMap(*self.doc_symbols_new.values())
-
         # exclude whitelist
         to_exclude = set()
         for packages in self.whitelist.values():
             to_exclude |= packages
 
-        res = []
-        for k, v in self.doc_symbols_new.items():
+        # merged in reverse so symbols of earlier packages take precedence, like they would in a chainmap
+        res = {}
+        for k, v in reversed(self.doc_symbols_new.items()):
             if k in to_exclude:
                 continue
-            res.append(v)
+            res.update(v)
 
-        return ChainMap(*res)
+        return res
 
     @property
-    def doc_symbols_all(self) -> typing.ChainMap[str, DocItem]:
+    def doc_symbols_all(self) -> Dict[str, DocItem]:
         """Returns all doc symbols, even whitelisted and blacklisted ones."""
-        return ChainMap(*self.doc_symbols_new.values())
+        return self._all_symbols
+
+    def _add_to_all_symbols(self, symbol_name: str, doc_item: DocItem) -> None:
+        """Add `doc_item` to the combined symbols, unless an earlier package already has `symbol_name`."""
+        if (item := self._all_symbols.get(symbol_name)) is None or item.package == doc_item.package:
+            self._all_symbols[symbol_name] = doc_item
 
-    def get_packages_for_guild(self, guild_id: int = None) -> typing.ChainMap[str, DocItem]:
+    def get_packages_for_guild(self, guild_id: int = None) -> Dict[str, DocItem]:
         """Gets packages whitelisted in the specific guild."""
-        if guild_id in self.whitelist:
-            return ChainMap(*[self.doc_symbols_new[pkg] for pkg in self.whitelist[guild_id]], self.doc_symbols)
-        return self.doc_symbols
+        if guild_id not in self.whitelist:
+            return self.doc_symbols
+
+        if (packages := self._guild_packages.get(guild_id)) is None:
+            # whitelisted packages are merged last in reverse, so they take precedence like they would in a chainmap
+            packages = dict(self.doc_symbols)
+            for pkg in reversed(list(self.whitelist[guild_id])):
+                packages.update(self.doc_symbols_new[pkg])
+            self._guild_packages[guild_id] = packages
+        return packages
+
+    def clear_search_caches(self) -> None:
+        """Clear the cached autocomplete choices and search results, after the symbols or whitelist changed."""
+        self._autocomplete_choices.clear()
+        self._score_query.cache_clear()
+        self._search_symbols.cache_clear()
+
+    @staticmethod
+    def find_prefixed(names: Tuple[str, ...], prefix: str) -> Tuple[int, int]:
+        """Get the start and end index of the names starting with `prefix` in the sorted `names`."""
+        # the names starting with the prefix are next to each other in the sorted names
+        start = bisect.bisect_left(names, prefix)
+        return start, bisect.bisect_left(names, prefix + "\U0010ffff", start)
+
+    def get_cache_key(self, guild_id: Optional[int]) -> Optional[int]:
+        """Get the key the guild's symbols are cached under, None for guilds without a whitelist or blacklist."""
+        if guild_id in self.whitelist or guild_id in BLACKLIST_MAPPING:
+            return guild_id
+        return None
+
+    def get_autocomplete_choices(self, guild_id: int = None) -> Tuple[str, ...]:
+        """Gets the symbol names which can be autocompleted in the specific guild."""
+        # the choices are sorted once per distinct configuration, rather than for every guild
+        guild_id = self.get_cache_key(guild_id)
+        if (choices := self._autocomplete_choices.get(guild_id)) is None:
+            blacklist = BLACKLIST_MAPPING.get(guild_id) or ()
+            packages = self.get_packages_for_guild(guild_id)
+            choices = tuple(sorted(name for name, item in packages.items() if item.package not in blacklist))
+            self._autocomplete_choices[guild_id] = choices
+        return choices
 
     def _get_default_completion(
         self,
@@ -297,12 +364,18 @@ class DocCog(commands.Cog):
             * `package` is the content of a intersphinx inventory.
         """
         self.base_urls[package_name] = base_url
+        # group names and url paths repeat across the package's symbols, so they share one copy through a table
+        # local to the package. Unlike sys.intern, group names aren't shared with other packages,
+        # which costs a few short strings per package.
+        intern = {}.setdefault
+        package_symbols = self.doc_symbols_new.setdefault(package_name, {})
+        blacklists = [BLACKLIST.setdefault(guild_id, set()) for guild_id in blacklist_guilds or ()]
 
         for group, items in inventory.items():
+            # e.g. get 'class' from 'py:class'
+            group_name = group.split(":")[1]
+            group_name = intern(group_name, group_name)
             for symbol_name, relative_doc_url in items:
-
-                # e.g. get 'class' from 'py:class'
-                group_name = group.split(":")[1]
                 symbol_name = self.ensure_unique_symbol_name(
                     package_name,
                     group_name,
@@ -310,28 +383,24 @@ class DocCog(commands.Cog):
                 )
 
                 relative_url_path, _, symbol_id = relative_doc_url.partition("#")
-                # Intern fields that have shared content so we're not storing unique strings for every object
                 doc_item = DocItem(
                     package_name,
-                    sys.intern(group_name),
+                    group_name,
                     base_url,
-                    sys.intern(relative_url_path),
+                    intern(relative_url_path, relative_url_path),
                     symbol_id,
                     symbol_name,
                 )
-                self.doc_symbols_new.setdefault(package_name, {})[sys.intern(symbol_name)] = doc_item
-                if blacklist_guilds:
-                    for guild_id in blacklist_guilds:
-                        if BLACKLIST.get(guild_id) is None:
-                            BLACKLIST[guild_id] = set()
-                        BLACKLIST[guild_id].add(symbol_name)
-
-                if (
-                    parent := self.doc_symbols_new[package_name].get(symbol_name.rsplit(".", 1)[0])
-                ) and parent.package == package_name:
+                package_symbols[symbol_name] = doc_item
+                self._add_to_all_symbols(symbol_name, doc_item)
+                for blacklist in blacklists:
+                    blacklist.add(symbol_name)
+
+                if (parent := package_symbols.get(symbol_name.rsplit(".", 1)[0])) and parent.package == package_name:
                     parent.attributes.append(doc_item)
                 self.item_fetcher.add_item(doc_item)
 
+        self.clear_search_caches()
         log.trace(f"Fetched inventory for {package_name}.")
 
     async def update_or_reschedule_inventory(
@@ -369,10 +438,7 @@ class DocCog(commands.Cog):
             if not base_url:
                 base_url = self.base_url_from_inventory_url(inventory_url)
             # determine blacklist
-            blacklist_guilds = []
-            for g, packs in BLACKLIST_MAPPING.items():
-                if api_package_name in packs:
-                    blacklist_guilds.append(g)
+            blacklist_guilds = [g for g, packs in BLACKLIST_MAPPING.items() if api_package_name in packs]
 
             self.update_single(api_package_name, base_url, package, blacklist_guilds)
 
@@ -385,25 +451,26 @@ class DocCog(commands.Cog):
 
         If the existing symbol was renamed or there was no conflict, the returned name is equivalent to `symbol_name`.
         """
-        if (item := self.doc_symbols_all.get(symbol_name)) is None:
+        if (item := self._all_symbols.get(symbol_name)) is None:
             return symbol_name  # There's no conflict so it's fine to simply use the given symbol name.
 
         def rename(prefix: str, *, rename_extant: bool = False) -> str:
             new_name = f"{prefix}.{symbol_name}"
-            if new_name in self.doc_symbols_all:
+            if new_name in self._all_symbols:
                 # If there's still a conflict, qualify the name further.
                 if rename_extant:
                     new_name = f"{item.package}.{item.group}.{symbol_name}"
                 else:
                     new_name = f"{package_name}.{group_name}.{symbol_name}"
 
-            self.renamed_symbols[symbol_name].append(new_name)
+            self.renamed_symbols.setdefault(symbol_name, []).append(new_name)
 
             if rename_extant:
                 # Instead of renaming the current symbol, rename the symbol with which it conflicts.
-                conflicting_symbol = self.doc_symbols_all[symbol_name]
+                conflicting_symbol = self._all_symbols[symbol_name]
                 package = conflicting_symbol.package
-                self.doc_symbols_new[package][sys.intern(new_name)] = conflicting_symbol
+                self.doc_symbols_new[package][new_name] = conflicting_symbol
+                self._add_to_all_symbols(new_name, conflicting_symbol)
                 return symbol_name
             else:
                 return new_name
@@ -417,11 +484,9 @@ class DocCog(commands.Cog):
 
         # If the symbol's group is a non-priority group from FORCE_PREFIX_GROUPS,
         # add it as a prefix to disambiguate the symbols.
-        elif group_name in FORCE_PREFIX_GROUPS:
-            if item.group in FORCE_PREFIX_GROUPS:
-                needs_moving = FORCE_PREFIX_GROUPS.index(group_name) < FORCE_PREFIX_GROUPS.index(item.group)
-            else:
-                needs_moving = False
+        elif (rank := FORCE_PREFIX_GROUP_RANKS.get(group_name)) is not None:
+            extant_rank = FORCE_PREFIX_GROUP_RANKS.get(item.group)
+            needs_moving = extant_rank is not None and rank < extant_rank
             return rename(item.group if needs_moving else group_name, rename_extant=needs_moving)
 
         # If the above conditions didn't pass, either the existing symbol has its group in FORCE_PREFIX_GROUPS,
@@ -444,12 +509,51 @@ class DocCog(commands.Cog):
             guild_id = int(guild[len(CONFIG_DOC_WHITELIST) + 1 :])
             self.whitelist[guild_id] = packages
 
+        self.clear_symbol_caches()
+        log.debug("Finished setting up the whitelist.")
+
+    def clear_symbol_caches(self) -> None:
+        """Clear everything cached from the symbols of the packages and the whitelist."""
+        self.clear_search_caches()
+        self._guild_packages.clear()
         # delete the cached doc_symbols
         try:
             del self.doc_symbols
         except AttributeError:
             pass
-        log.debug("Finished setting up the whitelist.")
+
+    async def remove_package(self, package_name: str) -> None:
+        """
+        Remove the package's symbols, without refreshing the inventories of the other packages.
+
+        Symbols which were renamed due to conflicts with the package keep their new names until the next refresh.
+        """
+        self.refresh_event.clear()
+        await self.symbol_get_event.wait()
+        if package_name in self.inventory_scheduler:
+            self.inventory_scheduler.cancel(package_name)
+        self.base_urls.pop(package_name, None)
+        if (package_symbols := self.doc_symbols_new.pop(package_name, None)) is None:
+            self.refresh_event.set()
+            return
+
+        for guild_id, packs in BLACKLIST_MAPPING.items():
+            if package_name in packs and guild_id in BLACKLIST:
+                BLACKLIST[guild_id].difference_update(package_symbols)
+        self.item_fetcher.remove_package(package_name)
+
+        # the package may have hidden symbols of later packages with the same name, so the combined dict is rebuilt
+        self._all_symbols.clear()
+        for symbols in reversed(self.doc_symbols_new.values()):
+            self._all_symbols.update(symbols)
+        for symbol_name, renamed in list(self.renamed_symbols.items()):
+            if renamed := [name for name in renamed if name in self._all_symbols]:
+                self.renamed_symbols[symbol_name] = renamed
+            else:
+                del self.renamed_symbols[symbol_name]
+
+        self.clear_symbol_caches()
+        self.refresh_event.set()
 
     async def refresh_inventories(self) -> None:
         """Refresh internal documentation inventories."""
@@ -460,13 +564,10 @@ class DocCog(commands.Cog):
 
         self.base_urls.clear()
         self.doc_symbols_new.clear()
+        self._all_symbols.clear()
         self.renamed_symbols.clear()
+        self.clear_search_caches()
         await self.item_fetcher.clear()
-        # delete the cached doc_symbols
-        try:
-            del self.doc_symbols
-        except AttributeError:
-            pass
 
         async def get_packages() -> list[dict[str, str]]:
             _, res = await self.bot.db.list_keys(CONFIG_DOC_INVENTORIES + ".")
@@ -483,20 +584,24 @@ class DocCog(commands.Cog):
 
             return packages.values()
 
-        coros = [
-            self.update_or_reschedule_inventory(package["package"], package["base_url"], package["inventory_url"])
-            for package in await get_packages()
-        ]
-        await asyncio.gather(*coros)
+        # limit how many inventories are fetched and parsed at once
+        semaphore = asyncio.Semaphore(INVENTORY_FETCH_CONCURRENCY)
+
+        async def update_package(package: dict[str, str]) -> None:
+            async with semaphore:
+                await self.update_or_reschedule_inventory(
+                    package["package"], package["base_url"], package["inventory_url"]
+                )
+
+        packages = list(await get_packages())
+        results = await asyncio.gather(*map(update_package, packages), return_exceptions=True)
+        for package, result in zip(packages, results):
+            if isinstance(result, Exception):
+                log.error(f"Failed to update the inventory of {package['package']}.", exc_info=result)
         log.debug("Finished inventory refresh.")
         log.debug("Refreshing whitelist and blacklist")
+        # this also invalidates the cached doc_symbols, now that all of the inventories are ready
         await self.refresh_whitelist_and_blacklist()
-        try:
-            del self.doc_symbols
-        except AttributeError:
-            pass
-        # recompute the symbols
-        self.doc_symbols
         self.refresh_event.set()
 
     def get_symbol_item(self, symbol_name: str) -> Tuple[str, Optional[DocItem]]:
@@ -506,10 +611,10 @@ class DocCog(commands.Cog):
         If the doc item is not found directly from the passed in name and the name contains a space,
         the first word of the name will be attempted to be used to get the item.
         """
-        doc_item = self.doc_symbols_all.get(symbol_name)
+        doc_item = self._all_symbols.get(symbol_name)
         if doc_item is None and " " in symbol_name:
             symbol_name = symbol_name.split(" ", maxsplit=1)[0]
-            doc_item = self.doc_symbols_all.get(symbol_name)
+            doc_item = self._all_symbols.get(symbol_name)
 
         return symbol_name, doc_item
 
@@ -569,9 +674,11 @@ class DocCog(commands.Cog):
 
             # Show all symbols with the same name that were renamed in the footer,
             # with a max of 200 chars.
-            if symbol_name in self.renamed_symbols:
-                renamed_symbols = ", ".join(self.renamed_symbols[symbol_name])
-                footer_text = textwrap.shorten("Similar names: " + renamed_symbols, 200, placeholder=" ...")
+            if renamed_symbols := self.renamed_symbols.get(symbol_name):
+                footer_text = "Similar names: " + ", ".join(renamed_symbols)
+                if len(footer_text) > 200:
+                    # cut at the last space that leaves room for the placeholder
+                    footer_text = footer_text[:197].rpartition(" ")[0] + " ..."
             else:
                 footer_text = ""
 
@@ -650,9 +757,17 @@ class DocCog(commands.Cog):
             symbol = search.strip("`")
             no_match = False
             tries = [symbol]
-            if maybe_start:
-                tries.append(symbol.split()[0])
+            # the first word is only worth trying if it differs, which it never does for the links in messages
+            if maybe_start and (words := symbol.split()) and words[0] != symbol:
+                tries.append(words[0])
+            guild_id = inter.guild.id if inter.guild else getattr(inter, "guild_id", None)
+            packages = self.get_packages_for_guild(guild_id)
+            blacklist = BLACKLIST_MAPPING.get(guild_id) or ()
             for sym in tries:
+                # an exact match is always ranked first, so there's no need to fuzzy match it
+                if (item := packages.get(sym.strip())) and item.package not in blacklist:
+                    sym = sym.strip()
+                    break
                 sym = await self._docs_autocomplete(inter, sym, threshold=threshold, scorer=scorer)
                 if sym:
                     sym = sym[0]
@@ -708,6 +823,48 @@ class DocCog(commands.Cog):
         """
         await self._docs_get_command(inter, query, maybe_start=False)
 
+    def _score_query(
+        self, guild_id: Optional[int], query: str, count: int, threshold: int, scorer: Any
+    ) -> Tuple[str, ...]:
+        """Get the names matching the stripped `query`, best first. Results are cached until the choices change."""
+        choices = self.get_autocomplete_choices(guild_id)
+
+        start, end = self.find_prefixed(choices, query)
+        if scorer is None and end - start >= count:
+            # the ratio of a name starting with the query only drops as the name gets longer,
+            # so when there are enough of them the shortest ones are used without fuzzy matching every name
+            fuzzed = [
+                (name, rapidfuzz.fuzz.ratio(query, name), None)
+                for name in heapq.nsmallest(count, choices[start:end], key=len)
+            ]
+        else:
+            # further fuzzy search by using rapidfuzz ratio matching
+            fuzzed = rapidfuzz.process.extract(
+                query=query,
+                choices=choices,
+                scorer=scorer or rapidfuzz.fuzz.ratio,
+                processor=None,
+                limit=count,
+                # scores are raised by up to 70 below, so only skip the matches which can't reach the threshold
+                score_cutoff=max(threshold - 70, 0),
+            )
+
+        tweak = []
+        lower_query = query.lower()
+        for name, score, _ in fuzzed:
+            lower = name.lower()
+
+            if lower == lower_query:
+                score += 50
+
+            if lower_query in lower:
+                score += 20
+
+            tweak.append((name, score))
+
+        # ties keep their order from rapidfuzz, as nlargest is equivalent to a stable sort
+        return tuple(name for name, score in heapq.nlargest(count, tweak, key=itemgetter(1)) if score >= threshold)
+
     async def _docs_autocomplete(
         self,
         inter: disnake.Interaction,
@@ -735,53 +892,31 @@ class DocCog(commands.Cog):
             return self._get_default_completion(inter, inter.guild)
         # ----------------------------------------------------
         guild_id = inter.guild and inter.guild.id or inter.guild_id
-        blacklist = BLACKLIST_MAPPING.get(guild_id)
 
         query = query.strip()
 
-        packages = self.get_packages_for_guild(guild_id)
-
-        def processor(sentence: str) -> str:
-            if (sym := self.doc_symbols_all.get(sentence)) and sym.package in blacklist:
-                return ""
-            else:
-                return sentence
-
-        # further fuzzy search by using rapidfuzz ratio matching
-        fuzzed = rapidfuzz.process.extract(
-            query=query,
-            choices=packages.keys(),
-            scorer=scorer or rapidfuzz.fuzz.ratio,
-            processor=processor if blacklist else None,
-            limit=count,
-        )
-
-        tweak = []
-        lower_query = query.lower()
-        for _, (name, score, _) in enumerate(fuzzed):
-            lower = name.lower()
-
-            if lower == query:
-                score += 50
-
-            if lower_query in lower:
-                score += 20
-
-            tweak.append((name, score))
-
-        tweak = list(sorted(tweak, key=lambda v: v[1], reverse=True))
-
         res = []
         if include_query:
             res.append(query)
-        for name, score in tweak:
-            if score < threshold:
-                break
-            res.append(name)
+        res.extend(self._score_query(self.get_cache_key(guild_id), query, count, threshold, scorer))
         return res
 
     docs_get_command.autocomplete("query")(copy.copy(_docs_autocomplete))
 
+    def _search_symbols(self, guild_id: Optional[int], query: str) -> Tuple[Tuple[str, str], ...]:
+        """Get up to 10 symbol names containing `query` and their urls, sorted by name. Results are cached."""
+        # the choices are sorted and have no blacklisted symbols, so names starting with the query are found directly
+        choices = self.get_autocomplete_choices(guild_id)
+        start, end = self.find_prefixed(choices, query)
+        names = list(choices[start : min(end, start + 10)])
+        if len(names) < 10:
+            # only scan for the names containing the query elsewhere when there aren't enough
+            contained = (name for name in choices if query in name and not name.startswith(query))
+            names.extend(itertools.islice(contained, 10 - len(names)))
+
+        packages = self.get_packages_for_guild(guild_id)
+        return tuple(sorted((name, packages[name].url + "#" + packages[name].symbol_id) for name in names))
+
     @slash_docs.sub_command(name="list")
     async def slash_docs_search(self, inter: disnake.AppCmdInter, query: str) -> None:
         """
@@ -791,34 +926,18 @@ class DocCog(commands.Cog):
         ----------
         query: search query
         """
-        results = {}
         guild_id = inter.guild and inter.guild.id or inter.guild_id
-        blacklist = BLACKLIST_MAPPING.get(guild_id)
 
         query = query.strip()
 
-        packages = self.get_packages_for_guild(guild_id)
-
-        for key, item in packages.items():
-            if query not in key:
-                continue
-
-            if blacklist and item.package in blacklist:
-                continue
-
-            results[key] = item.url + "#" + item.symbol_id
-            if len(results) >= 10:
-                break
+        results = self._search_symbols(self.get_cache_key(guild_id), query)
         # if no results
         if not results:
             await inter.response.send_message(f"No documentation results found for `{query}`.", ephemeral=True)
+            return
         # construct embed
-        results = {key: val for key, val in sorted(results.items(), key=lambda x: x[0])}
-
         embed = disnake.Embed(title=f"Results for {query}")
-        embed.description = ""
-        for res, url in results.items():
-            embed.description += f"[`{res}`]({url})\n"
+        embed.description = "".join(f"[`{res}`]({url})\n" for res, url in results)
 
         view = DeleteView(inter.author, inter)
         await inter.response.send_message(embed=embed, view=view)
@@ -942,9 +1061,9 @@ class DocCog(commands.Cog):
         await self.bot.db.delete_keys(*keys)
 
         async with ctx.typing():
-            await self.refresh_inventories()
+            await self.remove_package(package_name)
             await doc_cache.delete(package_name)
-        await ctx.send(f"Successfully deleted `{package_name}` and refreshed the inventories.")
+        await ctx.send(f"Successfully deleted `{package_name}`.")
 
     @docs_group.command(name="refreshdoc", aliases=("rfsh", "r"))
     @commands.is_owner()
@@ -1020,20 +1139,21 @@ class DocCog(commands.Cog):
             return
 
         guild_ids = [g.id for g in guild_ids]
-        for guild_id in guild_ids:
-            key_name = f"{CONFIG_DOC_WHITELIST}.{guild_id}"
-            _, keys = await self.bot.db.fetch_keys(key_name)
-            keys = keys["config"]
-            if keys:
-                value = keys.pop(key_name)
-                if package_name in value.split(","):
-                    log.debug(f"{package_name} is already whitelisted in {guild_id}")
-                    continue
-            else:
-                value = ""
-            value = ",".join(sorted([x for x in value.split(",") + [package_name] if x]))
+        key_names = {guild_id: f"{CONFIG_DOC_WHITELIST}.{guild_id}" for guild_id in guild_ids}
+        # fetch and update the whitelists of all guilds at once
+        _, keys = await self.bot.db.fetch_keys(*key_names.values())
+        keys = keys["config"]
+        updated = {}
+        for guild_id, key_name in key_names.items():
+            packages = set(filter(None, (keys.get(key_name) or "").split(",")))
+            if package_name in packages:
+                log.debug(f"{package_name} is already whitelisted in {guild_id}")
+                continue
+            packages.add(package_name)
+            updated[key_name] = ",".join(sorted(packages))
 
-            await self.bot.db.put_keys(**{key_name: value})
+        if updated:
+            await self.bot.db.put_keys(**updated)
 
         await self.refresh_whitelist_and_blacklist()
 
@@ -1062,21 +1182,29 @@ class DocCog(commands.Cog):
             return
 
         guild_ids = [g.id for g in guild_ids]
-        for guild_id in guild_ids:
-            key_name = f"{CONFIG_DOC_WHITELIST}.{guild_id}"
-            _, keys = await self.bot.db.fetch_keys(key_name)
-            keys = keys["config"]
-            if not keys:
+        key_names = {guild_id: f"{CONFIG_DOC_WHITELIST}.{guild_id}" for guild_id in guild_ids}
+        # fetch and update the whitelists of all guilds at once
+        _, keys = await self.bot.db.fetch_keys(*key_names.values())
+        keys = keys["config"]
+        updated = {}
+        deleted = []
+        for guild_id, key_name in key_names.items():
+            if not (value := keys.get(key_name)):
                 continue
-            value = keys.pop(key_name)
-            if package_name not in value.split(","):
+            packages = set(filter(None, value.split(",")))
+            if package_name not in packages:
                 log.debug(f"{package_name} is not whitelisted in {guild_id}")
                 continue
-            value = [x for x in value.split(",") if x != package_name]
-            if value:
-                await self.bot.db.put_keys(**{key_name: value})
+            packages.remove(package_name)
+            if packages:
+                updated[key_name] = ",".join(sorted(packages))
             else:
-                await self.bot.db.delete_keys(key_name)
+                deleted.append(key_name)
+
+        if updated:
+            await self.bot.db.put_keys(**updated)
+        if deleted:
+            await self.bot.db.delete_keys(*deleted)
 
         await self.refresh_whitelist_and_blacklist()
 
@@ -1091,10 +1219,12 @@ class DocCog(commands.Cog):
             return
         if message.author.bot:
             return
+        if DOCS_LINK_ANCHOR not in message.content:
+            return
 
-        matches: list[str] = list(
-            dict.fromkeys([match for match in DOCS_LINK_REGEX.findall(message.content)][:10], None)
-        )
+        # only the first 10 links are used, so the rest of the message isn't scanned
+        links = itertools.islice(DOCS_LINK_REGEX.finditer(message.content), 10)
+        matches: list[str] = list(dict.fromkeys(match[1] for match in links))
         if not matches:
             return
 
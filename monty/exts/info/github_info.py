@@ -83,6 +83,8 @@ GITHUB_GUILDS = TEST_GUILDS if TEST_GUILDS else GUILD_WHITELIST
 class FoundIssue:
     """Dataclass representing an issue found by the regex."""
 
+    __slots__ = ("organisation", "repository", "number")
+
     organisation: t.Optional[str]
     repository: str
     number: str
@@ -95,6 +97,8 @@ class FoundIssue:
 class FetchError:
     """Dataclass representing an error while fetching an issue."""
 
+    __slots__ = ("return_code", "message")
+
     return_code: int
     message: str
 
@@ -103,6 +107,8 @@ class FetchError:
 class IssueState:
     """Dataclass representing the state of an issue."""
 
+    __slots__ = ("repository", "number", "url", "title", "emoji")
+
     repository: str
     number: int
     url: str
@@ -138,7 +144,6 @@ class GithubInfo(commands.Cog):
         """Fetch and populate the repos on load."""
         await self.bot.wait_until_ready()
         for guild, user in GUILD_WHITELIST.items():
-            print(guild, user)
             if not self.bot.get_guild(guild):
                 continue
             url = ORG_REPOS_ENDPOINT.format(org=user)
@@ -468,7 +473,6 @@ class GithubInfo(commands.Cog):
             open_emoji = constants.Emojis.pull_request_open
             closed_emoji = constants.Emojis.pull_request_closed
         endpoint = endpoint.format(user=user, repository=repo)
-        print(endpoint)
         json = await self.fetch_data(endpoint)
         prs = []
         for pull_data in json:
@@ -521,7 +525,6 @@ class GithubInfo(commands.Cog):
         else:
             req_perm = "send_messages"
         if not getattr(perms, req_perm):
-            print(perms)
             log.warn("I don't have send perms.")
             return
 
@@ -2,7 +2,7 @@ import random
 
 import disnake
 import psutil
-from disnake.ext import commands
+from disnake.ext import commands, tasks
 from disnake.ext.commands import Range
 
 from monty.bot import Bot
@@ -64,6 +64,25 @@ class Meta(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        self.cpu_usage = 0.0
+        self.memory_usage = 0.0
+        self.sample_usage.start()
+
+    def cog_unload(self) -> None:
+        """Stop sampling the system usage on cog unload."""
+        self.sample_usage.cancel()
+
+    @tasks.loop(seconds=5)
+    async def sample_usage(self) -> None:
+        """Sample the system usage, so the cpu usage is averaged over the time since the last sample."""
+        self.cpu_usage = psutil.cpu_percent()
+        self.memory_usage = psutil.virtual_memory().percent
+
+    async def send_deletable(self, inter: disnake.CommandInteraction, embed: disnake.Embed) -> None:
+        """Respond to `inter` with `embed` and a button for its author to delete it."""
+        view = DeleteView(inter.author, inter)
+        await inter.send(embed=embed, view=view)
+        self.bot.loop.create_task(wait_for_deletion(inter, view=view))
 
     @commands.slash_command(name="monty")
     async def monty(self, inter: disnake.CommandInteraction) -> None:
@@ -83,9 +102,7 @@ class Meta(commands.Cog):
         e.set_thumbnail(url=self.bot.user.display_avatar.url)
         e.set_footer(text="Last started", icon_url=self.bot.user.display_avatar.url)
 
-        view = DeleteView(inter.author, inter)
-        await inter.send(embed=e, view=view)
-        self.bot.loop.create_task(wait_for_deletion(inter, view=view))
+        await self.send_deletable(inter, e)
 
     @monty.sub_command(name="credits")
     async def credits(self, inter: disnake.CommandInteraction) -> None:
@@ -128,9 +145,7 @@ class Meta(commands.Cog):
             colour=Colours.bright_green,
             description=f"Gateway Latency: {round(self.bot.latency * 1000)}ms",
         )
-        view = DeleteView(inter.author, inter)
-        await inter.send(embed=embed, view=view)
-        self.bot.loop.create_task(wait_for_deletion(inter, view=view))
+        await self.send_deletable(inter, embed)
 
     @monty.sub_command(name="stats")
     async def status(self, inter: disnake.CommandInteraction) -> None:
@@ -147,13 +162,11 @@ class Meta(commands.Cog):
             guilds=len(self.bot.guilds),
             users=len(self.bot.users),
             channels=sum(len(guild.channels) for guild in self.bot.guilds),
-            memory_usage=psutil.virtual_memory().percent,
-            cpu_usage=psutil.cpu_percent(),
+            memory_usage=self.memory_usage,
+            cpu_usage=self.cpu_usage,
         )
 
-        view = DeleteView(inter.author, inter)
-        await inter.send(embed=e, view=view)
-        self.bot.loop.create_task(wait_for_deletion(inter, view=view))
+        await self.send_deletable(inter, e)
 
     @monty.sub_command()
     async def uptime(self, inter: disnake.ApplicationCommandInteraction) -> None:
@@ -161,9 +174,7 @@ class Meta(commands.Cog):
         timestamp = round(float(self.bot.start_time.format("X")))
         embed = disnake.Embed(title="Up since:", description=f"<t:{timestamp}:F> (<t:{timestamp}:R>)")
 
-        view = DeleteView(inter.author, inter)
-        await inter.send(embed=embed, view=view)
-        self.bot.loop.create_task(wait_for_deletion(inter, view=view))
+        await self.send_deletable(inter, embed)
 
 
 def setup(bot: Bot) -> None:
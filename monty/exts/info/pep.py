@@ -251,7 +251,7 @@ class PythonEnhancementProposals(commands.Cog):
             peps[title] = pep
 
         if not len(peps):
-            print("nomatch")
+            log.trace(f"No PEPs matched the autocomplete query {query!r}")
 
         return peps
 
@@ -1,4 +1,4 @@
-from typing import Sequence, Union
+from typing import Iterable, Union
 
 import disnake
 import disnake.ext.commands
@@ -8,22 +8,25 @@ from monty import constants
 
 VIEW_DELETE_ID = "wait_for_deletion_interaction_trash"
 
+UserOrId = Union[disnake.User, int]
+
 
 class DeleteView(disnake.ui.View):
     """This should only be used on responses from interactions."""
 
     def __init__(
         self,
-        users: Union[disnake.User, int, Sequence[Union[disnake.User, int]]],
+        users: Union[UserOrId, Iterable[UserOrId]],
         initial_inter: disnake.Interaction = None,
         *,
         timeout: float = 500,
         allow_manage_messages: bool = True,
     ):
-        if isinstance(users, Sequence):
-            self.user_ids = {getattr(user, "id", user) for user in users}
-        else:
+        # checking for a single user first avoids the much slower abc instance check on every response
+        if isinstance(users, int) or hasattr(users, "id"):
             self.user_ids = {getattr(users, "id", users)}
+        else:
+            self.user_ids = {getattr(user, "id", user) for user in users}
         self.inter = initial_inter
         super().__init__(timeout=timeout)
         self.deleted = False
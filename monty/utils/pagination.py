@@ -147,7 +147,6 @@ class LinePaginator(Paginator):
             )
             # check the custom_id is valid
             name = cls.strip_custom_id(inter.data.custom_id)
-            print(user_valid)
             check = all(
                 # Conditions for a successful pagination:
                 (
@@ -377,7 +376,7 @@ class ImagePaginator(Paginator):
                     # Reaction is on the same message sent
                     reaction_.message.id == message.id,
                     # The reaction is part of the navigation menu
-                    str(reaction_.emoji) in PAGINATION_EMOJI,  # Note: DELETE_EMOJI is a string and not unicode
+                    str(reaction_.emoji) in PAGINATION_EMOJI.values(),  # Note: DELETE_EMOJI is a string and not unicode
                     # The reactor is not a bot
                     not member.bot,
                 )
@@ -411,7 +410,7 @@ class ImagePaginator(Paginator):
         embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
         message = await ctx.send(embed=embed)
 
-        for emoji in PAGINATION_EMOJI:
+        for emoji in PAGINATION_EMOJI.values():
             await message.add_reaction(emoji)
 
         while True:
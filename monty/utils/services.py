@@ -12,6 +12,8 @@ log = get_logger(__name__)
 FAILED_REQUEST_ATTEMPTS = 3
 
 PASTE_DISABLED = URLs.paste_service is None
+# the content type aiohttp would set for a str body, needed since the contents are sent as bytes
+PASTE_HEADERS = {"Content-Type": "text/plain; charset=utf-8"}
 
 
 async def send_to_paste_service(contents: str, *, extension: str = "") -> Optional[str]:
@@ -25,12 +27,13 @@ async def send_to_paste_service(contents: str, *, extension: str = "") -> Option
     if PASTE_DISABLED:
         return "Sorry, paste isn't configured!"
 
-    log.debug(f"Sending contents of size {len(contents.encode())} bytes to paste service.")
+    log.debug(f"Sending contents of {len(contents)} characters to paste service.")
+    # encoded once rather than by aiohttp on every attempt
+    data = contents.encode()
     paste_url = URLs.paste_service.format(key="api/new")
     for attempt in range(1, FAILED_REQUEST_ATTEMPTS + 1):
         try:
-            print(paste_url)
-            async with bot.http_session.post(paste_url, data=contents) as response:
+            async with bot.http_session.post(paste_url, data=data, headers=PASTE_HEADERS) as response:
                 response_json = await response.json()
         except ClientConnectorError:
             log.warning(